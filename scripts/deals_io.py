@@ -0,0 +1,43 @@
+"""
+Deals JSON Writer
+Shared deals.json output used by every script that writes the file
+"""
+
+import json
+import os
+
+# Compact encoder reused for every deal record (json.dumps builds a new one per call)
+DEAL_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+
+def dump_deals_json(data: dict, f, indent: int = None):
+    """
+    Write deals data as JSON, one compact deal per line.
+    
+    Each deal is encoded separately with json's C encoder; passing indent to
+    json.dump would route the whole (multi-MB) file through the pure-Python
+    encoder instead. Pass indent only when a fully indented file is wanted
+    (e.g. for reading by hand); `python -m json.tool` gives the same view.
+    """
+    if indent is not None:
+        json.dump(data, f, ensure_ascii=False, indent=indent)
+        f.write('\n')
+        return
+    
+    fields = []
+    for key, value in data.items():
+        if key == 'deals' and value:
+            deal_lines = ',\n    '.join(map(DEAL_ENCODER.encode, value))
+            fields.append(f'  "deals": [\n    {deal_lines}\n  ]')
+        else:
+            fields.append(f'  {json.dumps(key)}: {DEAL_ENCODER.encode(value)}')
+    
+    f.write('{\n' + ',\n'.join(fields) + '\n}\n')
+
+
+def save_deals_json(data: dict, deals_file, indent: int = None):
+    """Save deals data to deals_file, writing a temp file first so an interrupted save can't corrupt it."""
+    tmp_file = os.fspath(deals_file) + '.tmp'
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        dump_deals_json(data, f, indent)
+    os.replace(tmp_file, deals_file)
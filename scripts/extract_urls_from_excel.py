@@ -6,12 +6,15 @@ This script parses the extracted Excel XML files to map deal titles to their
 actual URLs, then updates deals.json to replace search URLs with actual ones.
 """
 
+import html
 import json
+import mmap
 import os
-import re
 import xml.etree.ElementTree as ET
-from pathlib import Path
-from urllib.parse import unquote, urlparse
+
+from deals_io import save_deals_json
+from xlsx_io import (CELL_TAG, HYPERLINK_TAG, HYPERLINKS_TAG, RELATIONSHIP_ID_ATTR, ROW_TAG, VALUE_TAG,
+                     iter_shared_strings, map_worksheets, scan_relationships)
 
 
 def parse_relationships(rels_file: str) -> dict:
@@ -19,19 +22,13 @@ def parse_relationships(rels_file: str) -> dict:
     rId_to_url = {}
     
     try:
-        # Read file content and extract relationships
-        with open(rels_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Find all Relationship elements with Target URLs
-        # Pattern: <Relationship Id="rIdXXX" ... Target="URL" TargetMode="External"/>
-        pattern = r'<Relationship\s+Id="(rId\d+)"[^>]*Type="[^"]*hyperlink"[^>]*Target="([^"]+)"'
-        matches = re.findall(pattern, content)
+        # An empty part has no relationships (and mmap can't map a zero-byte file)
+        if os.path.getsize(rels_file) == 0:
+            return rId_to_url
         
-        for rId, url in matches:
-            # Decode HTML entities
-            url = url.replace('&amp;', '&')
-            rId_to_url[rId] = url
+        # Memory-map the file and scan it as bytes, decoding only the matches
+        with open(rels_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            rId_to_url = scan_relationships(content)
     
     except Exception as e:
         print(f"Error parsing {rels_file}: {e}")
@@ -44,22 +41,7 @@ def parse_shared_strings(shared_strings_file: str) -> list:
     strings = []
     
     try:
-        with open(shared_strings_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Parse each <si> element (string item)
-        # Each <si> can contain one or more <t> elements
-        si_pattern = r'<si>(.*?)</si>'
-        si_matches = re.findall(si_pattern, content, re.DOTALL)
-        
-        for si_content in si_matches:
-            # Extract all text from <t> elements within this <si>
-            t_pattern = r'<t[^>]*>([^<]*)</t>'
-            t_matches = re.findall(t_pattern, si_content)
-            
-            # Combine all text from the <t> elements
-            full_text = ''.join(t_matches).strip()
-            strings.append(full_text)
+        strings.extend(iter_shared_strings(shared_strings_file))
         
         print(f"  Sample strings: {strings[:5] if strings else 'none'}")
     
@@ -69,48 +51,46 @@ def parse_shared_strings(shared_strings_file: str) -> list:
     return strings
 
 
-def parse_worksheet(sheet_file: str, rels_file: str, shared_strings: list) -> dict:
-    """Parse a worksheet to get cell values and hyperlinks."""
+def parse_worksheet(sheet_file: str, rId_to_url: dict, shared_strings: list) -> tuple:
+    """
+    Parse a worksheet to get shared-string cell values and hyperlinks in a
+    single streaming pass. Numeric cells and out-of-range string indexes are
+    skipped, so every returned value is real sheet text.
+    """
     cell_values = {}
     cell_hyperlinks = {}
     
     try:
-        with open(sheet_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Parse relationships to get URLs
-        rId_to_url = parse_relationships(rels_file)
-        
-        # Find cell values - pattern: <c r="A1" ...><v>value</v></c>
-        # If t="s", value is an index into shared strings
-        cell_pattern = r'<c\s+r="([A-Z]+\d+)"[^>]*(?:t="s")?[^>]*>(?:<[^v][^>]*>)*<v>(\d+)</v>'
-        for match in re.finditer(cell_pattern, content):
-            cell_ref = match.group(1)
-            value_idx = int(match.group(2))
+        for _, elem in ET.iterparse(sheet_file):
+            tag = elem.tag
             
-            # Check if this is a shared string reference
-            if 't="s"' in match.group(0) and value_idx < len(shared_strings):
-                cell_values[cell_ref] = shared_strings[value_idx]
-            else:
-                cell_values[cell_ref] = str(value_idx)
-        
-        # Find hyperlinks - pattern: <hyperlink r:id="rIdXXX" ref="A1"/>
-        hyperlink_pattern = r'<hyperlink\s+r:id="(rId\d+)"\s+ref="([A-Z]+\d+)"'
-        for match in re.finditer(hyperlink_pattern, content):
-            rId = match.group(1)
-            cell_ref = match.group(2)
+            # Cell values - <c r="A1" t="s" ...><v>index</v></c>
+            # Only t="s" cells hold text (an index into shared strings)
+            if tag == CELL_TAG:
+                if elem.get('t') != 's':
+                    continue
+                
+                value = elem.findtext(VALUE_TAG)
+                if value is None or not value.isdigit():
+                    continue
+                
+                value_idx = int(value)
+                if value_idx < len(shared_strings):
+                    cell_values[elem.get('r')] = shared_strings[value_idx]
             
-            if rId in rId_to_url:
-                cell_hyperlinks[cell_ref] = rId_to_url[rId]
-        
-        # Also check alternate order
-        hyperlink_pattern2 = r'<hyperlink\s+[^>]*ref="([A-Z]+\d+)"[^>]*r:id="(rId\d+)"'
-        for match in re.finditer(hyperlink_pattern2, content):
-            cell_ref = match.group(1)
-            rId = match.group(2)
+            # Rows are fully consumed once their cells are read
+            elif tag == ROW_TAG:
+                elem.clear()
             
-            if rId in rId_to_url:
-                cell_hyperlinks[cell_ref] = rId_to_url[rId]
+            # Hyperlinks - <hyperlink r:id="rIdXXX" ref="A1"/> (attributes in any order)
+            elif tag == HYPERLINK_TAG:
+                url = rId_to_url.get(elem.get(RELATIONSHIP_ID_ATTR))
+                if url:
+                    cell_hyperlinks[elem.get('ref')] = url
+            
+            # Nothing after <hyperlinks> (page setup, drawings, ...) is needed
+            elif tag == HYPERLINKS_TAG:
+                break
     
     except Exception as e:
         print(f"Error parsing worksheet: {e}")
@@ -118,6 +98,30 @@ def parse_worksheet(sheet_file: str, rels_file: str, shared_strings: list) -> di
     return cell_values, cell_hyperlinks
 
 
+def parse_sheet_deal_urls(sheet_file: str, rels_file: str, shared_strings: list) -> tuple:
+    """Map deal titles to URLs for a single worksheet."""
+    title_to_url = {}
+    
+    # Get URLs directly from the rels file
+    rId_to_url = parse_relationships(rels_file)
+    
+    # Read cell values and hyperlinked cells from the sheet
+    cell_values, cell_hyperlinks = parse_worksheet(sheet_file, rId_to_url, shared_strings)
+    
+    for cell_ref, title in cell_values.items():
+        # Column C appears to contain the deal title based on the hyperlinks
+        if cell_ref[0] != 'C' or not cell_ref[1:].isdigit() or cell_ref not in cell_hyperlinks:
+            continue
+        
+        url = cell_hyperlinks[cell_ref]
+        
+        # Only include slickdeals URLs with /f/ pattern
+        if 'slickdeals.net/f/' in url or 'slickdeals.net?sdtrk=bfsheet&u2=' in url:
+            title_to_url[title] = url
+    
+    return len(rId_to_url), len(cell_hyperlinks), title_to_url
+
+
 def extract_deal_urls(extract_dir: str) -> dict:
     """Extract title-to-URL mappings from the extracted Excel directory."""
     title_to_url = {}
@@ -127,81 +131,57 @@ def extract_deal_urls(extract_dir: str) -> dict:
     
     print(f"Loaded {len(shared_strings)} shared strings")
     
-    # Process each worksheet
+    # Collect the worksheets that have hyperlink relationships
     worksheets_dir = os.path.join(extract_dir, 'xl', 'worksheets')
     rels_dir = os.path.join(worksheets_dir, '_rels')
     
-    for sheet_file in sorted(Path(worksheets_dir).glob('sheet*.xml')):
-        sheet_name = sheet_file.stem
-        rels_file = os.path.join(rels_dir, f'{sheet_name}.xml.rels')
+    # One directory listing each for the sheets and their rels, instead of a
+    # glob plus an exists() check per sheet
+    sheet_files = []
+    if os.path.isdir(worksheets_dir):
+        with os.scandir(worksheets_dir) as entries:
+            sheet_files = sorted(entry.name for entry in entries
+                                 if entry.name.startswith('sheet') and entry.name.endswith('.xml'))
+    
+    rels_files = set()
+    if os.path.isdir(rels_dir):
+        with os.scandir(rels_dir) as entries:
+            rels_files = {entry.name for entry in entries}
+    
+    sheets = []
+    for sheet_file in sheet_files:
+        sheet_name = sheet_file[:-len('.xml')]
         
-        if not os.path.exists(rels_file):
+        if f'{sheet_name}.xml.rels' not in rels_files:
             print(f"No rels file for {sheet_name}, skipping")
             continue
         
+        sheets.append((sheet_name, os.path.join(worksheets_dir, sheet_file),
+                       os.path.join(rels_dir, f'{sheet_name}.xml.rels')))
+    
+    if not sheets:
+        return title_to_url
+    
+    # Results come back in sheet order, so later sheets still win on duplicate titles
+    sheet_results = map_worksheets(parse_sheet_deal_urls, shared_strings,
+                                   [sheet_file for _, sheet_file, _ in sheets],
+                                   [rels_file for _, _, rels_file in sheets])
+    
+    for (sheet_name, _, _), (rel_count, link_count, sheet_urls) in zip(sheets, sheet_results):
         print(f"Processing {sheet_name}...")
-        
-        # Get URLs directly from the rels file
-        rId_to_url = parse_relationships(rels_file)
-        print(f"  Found {len(rId_to_url)} hyperlink relationships")
-        
-        # Read the sheet to find which cells have hyperlinks
-        with open(sheet_file, 'r', encoding='utf-8') as f:
-            sheet_content = f.read()
-        
-        # Parse hyperlinks with both attribute orders
-        hyperlink_pattern = r'<hyperlink\s+[^>]*r:id="(r?Id\d+)"[^>]*ref="([A-Z]+)(\d+)"'
-        hyperlink_pattern2 = r'<hyperlink\s+[^>]*ref="([A-Z]+)(\d+)"[^>]*r:id="(r?Id\d+)"'
-        
-        cell_hyperlinks = {}
-        for match in re.finditer(hyperlink_pattern, sheet_content):
-            rId = match.group(1)
-            col = match.group(2)
-            row = int(match.group(3))
-            cell_ref = f"{col}{row}"
-            
-            if rId in rId_to_url:
-                cell_hyperlinks[cell_ref] = rId_to_url[rId]
-        
-        for match in re.finditer(hyperlink_pattern2, sheet_content):
-            col = match.group(1)
-            row = int(match.group(2))
-            rId = match.group(3)
-            cell_ref = f"{col}{row}"
-            
-            if rId in rId_to_url:
-                cell_hyperlinks[cell_ref] = rId_to_url[rId]
-        
-        print(f"  Mapped {len(cell_hyperlinks)} cell hyperlinks")
-        
-        # Find cell values with shared strings
-        # Pattern: <c r="C5" s="X" t="s"><v>123</v></c>
-        cell_pattern = r'<c\s+r="([A-Z]+)(\d+)"[^>]*t="s"[^>]*><v>(\d+)</v></c>'
-        
-        for match in re.finditer(cell_pattern, sheet_content):
-            col = match.group(1)
-            row = int(match.group(2))
-            string_idx = int(match.group(3))
-            cell_ref = f"{col}{row}"
-            
-            # Column C appears to contain the deal title based on the hyperlinks
-            if col == 'C' and cell_ref in cell_hyperlinks:
-                if string_idx < len(shared_strings):
-                    title = shared_strings[string_idx]
-                    url = cell_hyperlinks[cell_ref]
-                    
-                    # Only include slickdeals URLs with /f/ pattern
-                    if 'slickdeals.net/f/' in url or 'slickdeals.net?sdtrk=bfsheet&u2=' in url:
-                        title_to_url[title] = url
+        print(f"  Found {rel_count} hyperlink relationships")
+        print(f"  Mapped {link_count} cell hyperlinks")
+        title_to_url.update(sheet_urls)
     
     return title_to_url
 
 
 def normalize_title(title: str) -> str:
     """Normalize a title for matching."""
-    # Remove extra whitespace and lowercase
-    title = re.sub(r'\s+', ' ', title.strip().lower())
-    return title
+    # Decode HTML entities first: sheet titles come out of the XML parser decoded,
+    # but many titles in deals.json still hold them raw (&amp;, &quot;, &#39;, ...)
+    # Then collapse whitespace (split() also strips the ends) and casefold
+    return ' '.join(html.unescape(title).split()).casefold()
 
 
 def update_deals_json(deals_file: str, title_to_url: dict) -> tuple:
@@ -210,30 +190,28 @@ def update_deals_json(deals_file: str, title_to_url: dict) -> tuple:
         data = json.load(f)
     
     # Create a normalized title lookup
-    normalized_lookup = {}
-    for title, url in title_to_url.items():
-        normalized_lookup[normalize_title(title)] = url
+    normalized_lookup = {normalize_title(title): url for title, url in title_to_url.items()}
     
-    updated = 0
+    # Deals still pointing at a search page (or with no direct /f/ link yet),
+    # paired with their normalized titles
+    targets = []
     for deal in data.get('deals', []):
         current_link = deal.get('link', '')
-        
-        # Skip if already has an actual URL
-        if '/f/' in current_link and 'newsearch' not in current_link:
-            continue
-        
+        if '/f/' not in current_link or 'newsearch' in current_link:
+            targets.append((deal, normalize_title(deal.get('title', ''))))
+    
+    updated = 0
+    for deal, normalized_deal_title in targets:
         # Try to find a matching URL by title
-        deal_title = deal.get('title', '')
-        normalized_deal_title = normalize_title(deal_title)
+        new_url = normalized_lookup.get(normalized_deal_title)
         
-        if normalized_deal_title in normalized_lookup:
-            new_url = normalized_lookup[normalized_deal_title]
+        if new_url is not None:
             deal['link'] = new_url
             updated += 1
     
     # Save updated data
-    with open(deals_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2)
+    if updated:
+        save_deals_json(data, deals_file)
     
     return updated, len(data.get('deals', []))
 
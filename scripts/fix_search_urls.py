@@ -7,12 +7,15 @@ Replaces search URLs with actual Slickdeals deal URLs in deals.json
 import json
 import re
 import sys
+import threading
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 from urllib.request import urlopen, Request
-from urllib.parse import quote, unquote, parse_qs, urlparse
-from urllib.error import URLError, HTTPError
+from urllib.parse import quote
+
+from deals_io import save_deals_json
 
 DATA_DIR = Path(__file__).parent.parent / 'data'
 DEALS_FILE = DATA_DIR / 'deals.json'
@@ -20,12 +23,28 @@ DEALS_FILE = DATA_DIR / 'deals.json'
 # User agent for web requests
 USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
 
+# Concurrent search requests, and the minimum spacing between any two of them
+MAX_WORKERS = 8
+REQUEST_INTERVAL = 0.5
+
+_rate_lock = threading.Lock()
+_next_request_time = 0.0
+
+
+def wait_for_request_slot():
+    """Block until the next request may be sent, keeping requests REQUEST_INTERVAL apart across threads."""
+    global _next_request_time
+    with _rate_lock:
+        now = time.monotonic()
+        delay = _next_request_time - now
+        _next_request_time = max(now, _next_request_time) + REQUEST_INTERVAL
+    if delay > 0:
+        time.sleep(delay)
+
 
 def is_search_url(url):
     """Check if URL is a search URL rather than a direct deal link."""
-    if not url:
-        return False
-    return 'newsearch.php' in url or '/newsearch.php' in url
+    return bool(url) and 'newsearch.php' in url
 
 
 def normalize_link(raw_link):
@@ -46,6 +65,25 @@ def normalize_link(raw_link):
         return link + '?sdtrk=bfsheet'
 
 
+@lru_cache(maxsize=8192)
+def clean_search_title(title: str) -> str:
+    """Strip price/store suffixes and variant notes from a title for use as a search query."""
+    search_title = title
+    for separator in [' $', ' from ', ' +', ' -', ' @']:
+        if separator in search_title:
+            search_title = search_title.split(separator)[0]
+    
+    search_title = search_title.replace('(various colors)', '').replace('(various sizes)', '')
+    search_title = search_title.replace('(select colors)', '').replace('(select sizes)', '')
+    return ' '.join(search_title.split()).strip()
+
+
+def save_deals(data: dict):
+    """Stamp and save deals.json."""
+    data['lastUpdated'] = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+    save_deals_json(data, DEALS_FILE)
+
+
 def fetch_actual_deal_url(title):
     """
     Search Slickdeals for a deal title and return the actual deal URL.
@@ -53,14 +91,7 @@ def fetch_actual_deal_url(title):
     """
     try:
         # Clean title for search
-        search_title = title
-        for separator in [' $', ' from ', ' +', ' -', ' @']:
-            if separator in search_title:
-                search_title = search_title.split(separator)[0]
-        
-        search_title = search_title.replace('(various colors)', '').replace('(various sizes)', '')
-        search_title = search_title.replace('(select colors)', '').replace('(select sizes)', '')
-        search_title = ' '.join(search_title.split()).strip()
+        search_title = clean_search_title(title)
         
         # Limit search to first 100 chars
         if len(search_title) > 100:
@@ -69,6 +100,9 @@ def fetch_actual_deal_url(title):
         # Search Slickdeals deals forum
         search_url = f'https://slickdeals.net/newsearch.php?searchin=first&forumchoice%5B%5D=9&q={quote(search_title)}'
         
+        # Be nice to the server - rate limit requests
+        wait_for_request_slot()
+        
         req = Request(search_url, headers={'User-Agent': USER_AGENT})
         with urlopen(req, timeout=15) as response:
             html = response.read().decode('utf-8', errors='ignore')
@@ -117,7 +151,8 @@ def fix_deals():
     
     # Find deals with search URLs
     search_url_deals = [d for d in deals if is_search_url(d.get('link', ''))]
-    print(f'Found {len(search_url_deals)} deals with search URLs to fix')
+    total = len(search_url_deals)
+    print(f'Found {total} deals with search URLs to fix')
     
     if not search_url_deals:
         print('No deals to fix!')
@@ -125,55 +160,62 @@ def fix_deals():
     
     fixed_count = 0
     failed_count = 0
+    unsaved_count = 0
     
+    # Searches are network-bound, so run them on a thread pool; results are
+    # applied to the deals here in the main thread as they complete
+    executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
     try:
-        for i, deal in enumerate(search_url_deals):
+        futures = {executor.submit(fetch_actual_deal_url, deal.get('title', '')): deal
+                   for deal in search_url_deals}
+        
+        for i, future in enumerate(as_completed(futures)):
+            deal = futures[future]
             title = deal.get('title', '')
-            old_link = deal.get('link', '')
             
-            print(f'[{i+1}/{len(search_url_deals)}] Processing: {title[:60]}...')
+            print(f'[{i+1}/{total}] Processed: {title[:60]}...')
             
-            # Try to find actual deal URL
-            actual_url = fetch_actual_deal_url(title)
+            actual_url = future.result()
             
             if actual_url:
                 # Update the deal with the actual URL
                 deal['link'] = normalize_link(actual_url)
                 print(f'  [OK] Fixed: {deal["link"][:70]}...')
                 fixed_count += 1
+                unsaved_count += 1
             else:
                 print(f'  [SKIP] Could not find deal URL, keeping search URL')
                 failed_count += 1
             
-            # Be nice to the server - rate limit requests
-            time.sleep(0.5)
-            
-            # Save progress every 50 deals
-            if (i + 1) % 50 == 0:
+            # Save progress every 50 deals, if any were fixed since the last save
+            if (i + 1) % 50 == 0 and unsaved_count:
                 print(f'\nSaving progress ({i+1} processed)...')
-                data['lastUpdated'] = datetime.utcnow().isoformat() + 'Z'
-                with open(DEALS_FILE, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
+                save_deals(data)
+                unsaved_count = 0
                 print('Progress saved.\n')
     except KeyboardInterrupt:
         print(f'\n\nInterrupted! Saving progress...')
-        data['lastUpdated'] = datetime.utcnow().isoformat() + 'Z'
-        with open(DEALS_FILE, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        executor.shutdown(wait=False, cancel_futures=True)
+        if unsaved_count:
+            save_deals(data)
         print(f'Progress saved. Fixed {fixed_count} deals so far.')
         sys.exit(0)
     
+    executor.shutdown()
+    
     # Final save
-    print(f'\nSaving final results...')
-    data['lastUpdated'] = datetime.utcnow().isoformat() + 'Z'
-    with open(DEALS_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    if unsaved_count:
+        print(f'\nSaving final results...')
+        save_deals(data)
     
     print(f'\n=== Summary ===')
-    print(f'Total deals with search URLs: {len(search_url_deals)}')
+    print(f'Total deals with search URLs: {total}')
     print(f'Successfully fixed: {fixed_count}')
     print(f'Could not fix: {failed_count}')
-    print(f'\nDone! Updated {DEALS_FILE}')
+    if fixed_count:
+        print(f'\nDone! Updated {DEALS_FILE}')
+    else:
+        print(f'\nDone! {DEALS_FILE} left unchanged')
 
 
 if __name__ == '__main__':
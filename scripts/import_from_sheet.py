@@ -7,20 +7,20 @@ For Excel files: Uses XML parsing to extract hyperlinks properly (openpyxl hangs
 For Google Sheets: Falls back to CSV export with search URL fallback
 """
 
-import json
 import csv
-import re
+import io
 import sys
 import time
 import zipfile
-import tempfile
-import shutil
-import os
-from datetime import datetime, timezone
+import xml.etree.ElementTree as ET
+from functools import lru_cache
 from pathlib import Path
-from urllib.request import urlopen, Request
-from urllib.parse import quote, urljoin
-from urllib.error import URLError, HTTPError
+from urllib.request import urlopen
+from urllib.parse import quote
+
+from deals_io import save_deals_json
+from xlsx_io import (CELL_TAG, HYPERLINK_TAG, HYPERLINKS_TAG, RELATIONSHIP_ID_ATTR, ROW_TAG, VALUE_TAG,
+                     iter_shared_strings, map_worksheets, scan_relationships)
 
 # Google Sheets CSV export URL
 SHEET_ID = '1AuBRXBOVzUCiH2sOv3sLOAq-6243gJc3gF0aACKgNlo'
@@ -32,28 +32,30 @@ DEALS_FILE = DATA_DIR / 'deals.json'
 # User agent for web requests
 USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
 
+# Timestamp for this import run, used for lastUpdated and any missing pubDates
+RUN_TIMESTAMP = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+
+# Worksheet parts inside the .xlsx (zip) archive
+WORKSHEETS_DIR = 'xl/worksheets/'
+SHARED_STRINGS_MEMBER = 'xl/sharedStrings.xml'
+
+# Worksheet columns that hold deal fields (see parse_excel_worksheet)
+DEAL_COLUMNS = frozenset('ABCDEFGH')
+
 
 # =============================================================================
 # EXCEL XML PARSING FUNCTIONS
-# (Used instead of openpyxl which hangs on large files with many hyperlinks)
+# (Streaming XML parse used instead of openpyxl, which hangs on large files
+# with many hyperlinks)
 # =============================================================================
 
-def parse_excel_relationships(rels_file: str) -> dict:
-    """Parse a .rels XML file to get rId -> URL mappings for hyperlinks."""
+def parse_excel_relationships(rels_file) -> dict:
+    """Parse a .rels XML file (binary file object) to get rId -> URL mappings for hyperlinks."""
     rId_to_url = {}
     
     try:
-        with open(rels_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Find all Relationship elements with hyperlink type and external Target
-        pattern = r'<Relationship\s+Id="(rId\d+)"[^>]*Type="[^"]*hyperlink"[^>]*Target="([^"]+)"'
-        matches = re.findall(pattern, content)
-        
-        for rId, url in matches:
-            # Decode HTML entities
-            url = url.replace('&amp;', '&')
-            rId_to_url[rId] = url
+        # Scan the raw bytes, decoding only the matches
+        rId_to_url = scan_relationships(rels_file.read())
     
     except Exception as e:
         print(f"  Warning: Error parsing rels file: {e}")
@@ -61,26 +63,12 @@ def parse_excel_relationships(rels_file: str) -> dict:
     return rId_to_url
 
 
-def parse_excel_shared_strings(shared_strings_file: str) -> list:
-    """Parse sharedStrings.xml to get string values by index."""
+def parse_excel_shared_strings(shared_strings_file) -> list:
+    """Parse sharedStrings.xml (binary file object) to get string values by index."""
     strings = []
     
     try:
-        with open(shared_strings_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Parse each <si> element (string item)
-        si_pattern = r'<si>(.*?)</si>'
-        si_matches = re.findall(si_pattern, content, re.DOTALL)
-        
-        for si_content in si_matches:
-            # Extract all text from <t> elements within this <si>
-            t_pattern = r'<t[^>]*>([^<]*)</t>'
-            t_matches = re.findall(t_pattern, si_content)
-            
-            # Combine all text from the <t> elements
-            full_text = ''.join(t_matches).strip()
-            strings.append(full_text)
+        strings.extend(iter_shared_strings(shared_strings_file))
     
     except Exception as e:
         print(f"  Warning: Error parsing shared strings: {e}")
@@ -88,160 +76,183 @@ def parse_excel_shared_strings(shared_strings_file: str) -> list:
     return strings
 
 
-def extract_excel_deals(extract_dir: str) -> list:
+def parse_excel_worksheet(sheet_file, rels_file, shared_strings: list) -> list:
     """
-    Extract deals with hyperlinks from an extracted Excel directory.
+    Extract candidate deal rows from a single worksheet (binary file objects).
     
-    Returns a list of dicts with: title, link, mainCategory, subCategory, 
-    salePrice, originalPrice, store, salePeriod, notes
+    Rows are returned in sheet order without cross-sheet deduplication, so each
+    worksheet can be parsed independently. Returns None if the sheet has no
+    hyperlink relationships.
     """
-    deals = []
-    seen_titles = set()  # Track seen titles to avoid duplicates across sheets
-    
-    # Load shared strings
-    shared_strings_file = os.path.join(extract_dir, 'xl', 'sharedStrings.xml')
-    shared_strings = []
-    if os.path.exists(shared_strings_file):
-        shared_strings = parse_excel_shared_strings(shared_strings_file)
-        print(f"  Loaded {len(shared_strings)} shared strings")
-    
-    # Process each worksheet
-    worksheets_dir = os.path.join(extract_dir, 'xl', 'worksheets')
-    rels_dir = os.path.join(worksheets_dir, '_rels')
-    
-    for sheet_file in sorted(Path(worksheets_dir).glob('sheet*.xml')):
-        sheet_name = sheet_file.stem
-        rels_file = os.path.join(rels_dir, f'{sheet_name}.xml.rels')
-        
-        if not os.path.exists(rels_file):
-            continue
+    # Get hyperlink URLs from rels file
+    rId_to_url = parse_excel_relationships(rels_file)
+    if not rId_to_url:
+        return None
+    
+    # Based on the Excel structure:
+    # Column A: Main Category, B: Sub Category, C: Item/Product (with hyperlink)
+    # D: Sale Price, E: Original Price, F: Store, G: Sale Period, H: Notes
+    #
+    # <sheetData> (the cells) comes before <hyperlinks> in the sheet XML, so
+    # keep just columns A-H per row while streaming the cells, then emit a
+    # deal as soon as each column C hyperlink is read.
+    row_cells = {}  # row number (digits) -> {column letter: value}
+    rows = []
+    
+    for _, elem in ET.iterparse(sheet_file):
+        tag = elem.tag
         
-        print(f"  Processing {sheet_name}...")
-        
-        # Get hyperlink URLs from rels file
-        rId_to_url = parse_excel_relationships(rels_file)
-        if not rId_to_url:
-            continue
-        
-        # Read the sheet content
-        with open(sheet_file, 'r', encoding='utf-8') as f:
-            sheet_content = f.read()
-        
-        # Map cell references to hyperlink URLs
-        cell_hyperlinks = {}
-        
-        # Pattern 1: <hyperlink r:id="rIdXXX" ref="C5"/>
-        hyperlink_pattern = r'<hyperlink\s+[^>]*r:id="(r?Id\d+)"[^>]*ref="([A-Z]+)(\d+)"'
-        for match in re.finditer(hyperlink_pattern, sheet_content):
-            rId = match.group(1)
-            col = match.group(2)
-            row = int(match.group(3))
-            cell_ref = f"{col}{row}"
-            
-            if rId in rId_to_url:
-                cell_hyperlinks[cell_ref] = rId_to_url[rId]
-        
-        # Pattern 2: <hyperlink ref="C5" r:id="rIdXXX"/>
-        hyperlink_pattern2 = r'<hyperlink\s+[^>]*ref="([A-Z]+)(\d+)"[^>]*r:id="(r?Id\d+)"'
-        for match in re.finditer(hyperlink_pattern2, sheet_content):
-            col = match.group(1)
-            row = int(match.group(2))
-            rId = match.group(3)
-            cell_ref = f"{col}{row}"
-            
-            if rId in rId_to_url:
-                cell_hyperlinks[cell_ref] = rId_to_url[rId]
-        
-        # Parse cell values from the sheet
-        # Build a mapping of cell_ref -> value
-        cell_values = {}
-        
-        # Pattern: <c r="C5" s="X" t="s"><v>123</v></c> (shared string)
+        # <c r="C5" s="X" t="s"><v>123</v></c> (shared string)
         # or: <c r="C5" s="X"><v>123</v></c> (inline value)
-        cell_pattern = r'<c\s+r="([A-Z]+)(\d+)"([^>]*)><v>([^<]*)</v></c>'
-        
-        for match in re.finditer(cell_pattern, sheet_content):
-            col = match.group(1)
-            row = int(match.group(2))
-            attrs = match.group(3)
-            value = match.group(4)
-            cell_ref = f"{col}{row}"
+        if tag == CELL_TAG:
+            cell_ref = elem.get('r') or ''
+            col = cell_ref[:1]
+            if col not in DEAL_COLUMNS or not cell_ref[1:2].isdigit():
+                continue
+            
+            value = elem.findtext(VALUE_TAG)
+            if value is None:
+                continue
             
             # Check if it's a shared string reference
-            if 't="s"' in attrs and value.isdigit():
+            if elem.get('t') == 's' and value.isdigit():
                 string_idx = int(value)
-                if string_idx < len(shared_strings):
-                    cell_values[cell_ref] = shared_strings[string_idx]
-            else:
-                cell_values[cell_ref] = value
+                if string_idx >= len(shared_strings):
+                    continue
+                value = shared_strings[string_idx]
+            
+            row_cells.setdefault(cell_ref[1:], {})[col] = value
         
-        # Extract deals from this sheet
-        # Based on the Excel structure:
-        # Column A: Main Category, B: Sub Category, C: Item/Product (with hyperlink)
-        # D: Sale Price, E: Original Price, F: Store, G: Sale Period, H: Notes
+        # Rows are fully consumed once their cells are read
+        elif tag == ROW_TAG:
+            elem.clear()
         
-        sheet_deals = 0
-        
-        # Find all rows that have a hyperlink in column C
-        for cell_ref, url in cell_hyperlinks.items():
-            if not cell_ref.startswith('C'):
-                continue
+        # <hyperlink r:id="rIdXXX" ref="C5"/> (attributes in any order)
+        elif tag == HYPERLINK_TAG:
+            cell_ref = elem.get('ref') or ''
+            row = cell_ref[1:]
             
-            row = int(cell_ref[1:])
+            # Only hyperlinks on column C cells, below the header rows
+            if not cell_ref.startswith('C') or not row.isdigit() or int(row) < 4:
+                continue
             
-            # Skip header rows
-            if row < 4:
+            url = rId_to_url.get(elem.get(RELATIONSHIP_ID_ATTR))
+            if url is None:
                 continue
             
+            cells = row_cells.get(row, {})
+            
             # Get the title from the same cell
-            title = cell_values.get(f'C{row}', '').strip()
+            title = cells.get('C', '').strip()
             if not title:
                 continue
             
-            # Skip if we've already seen this title (deduplication across sheets)
-            if title in seen_titles:
-                continue
-            seen_titles.add(title)
-            
             # Get other fields
-            main_category = cell_values.get(f'A{row}', 'Uncategorized').strip()
-            sub_category = cell_values.get(f'B{row}', '').strip()
+            main_category = cells.get('A', 'Uncategorized').strip()
             # Note: Column D is Original Price, Column E is Sale Price in the spreadsheet
-            original_price = cell_values.get(f'D{row}', '').strip()
-            sale_price = cell_values.get(f'E{row}', '').strip()
-            store = cell_values.get(f'F{row}', '').strip()
-            sale_period = cell_values.get(f'G{row}', '').strip()
-            notes = cell_values.get(f'H{row}', '').strip()
+            rows.append({
+                'title': title,
+                # Normalize the URL with tracking parameter
+                'link': normalize_link(url),
+                'mainCategory': main_category if main_category else 'Uncategorized',
+                'subCategory': cells.get('B', '').strip(),
+                'salePrice': cells.get('E', '').strip(),
+                'originalPrice': cells.get('D', '').strip(),
+                'store': cells.get('F', '').strip(),
+                'salePeriod': cells.get('G', '').strip(),
+                'notes': cells.get('H', '').strip(),
+            })
+        
+        # Nothing after <hyperlinks> (page setup, drawings, ...) is needed
+        elif tag == HYPERLINKS_TAG:
+            break
+    
+    return rows
+
+
+def parse_excel_worksheet_member(excel_path: str, sheet_member: str, rels_member: str, shared_strings: list) -> list:
+    """Open a worksheet and its rels part inside the archive and parse them (see parse_excel_worksheet)."""
+    # Each call opens its own handle on the archive, so it can run in a worker process
+    with zipfile.ZipFile(excel_path) as zip_ref:
+        with zip_ref.open(sheet_member) as sheet_file, zip_ref.open(rels_member) as rels_file:
+            return parse_excel_worksheet(sheet_file, rels_file, shared_strings)
+
+
+def extract_excel_deals(excel_path: str) -> list:
+    """
+    Extract deals with hyperlinks from an Excel (.xlsx) file.
+    
+    Worksheet parts are streamed straight out of the zip archive; nothing is
+    extracted to disk.
+    
+    Returns a list of dicts with: title, link, mainCategory, subCategory, 
+    salePrice, originalPrice, store, salePeriod, notes
+    """
+    deals = []
+    seen_titles = set()  # Hashes of normalized titles seen, to avoid duplicates across sheets
+    
+    with zipfile.ZipFile(excel_path, 'r') as zip_ref:
+        members = set(zip_ref.namelist())
+        
+        # Load shared strings
+        shared_strings = []
+        if SHARED_STRINGS_MEMBER in members:
+            with zip_ref.open(SHARED_STRINGS_MEMBER) as shared_strings_file:
+                shared_strings = parse_excel_shared_strings(shared_strings_file)
+            print(f"  Loaded {len(shared_strings)} shared strings")
+    
+    # Collect the worksheets (xl/worksheets/sheet*.xml) that have hyperlink relationships
+    sheets = []
+    for sheet_member in sorted(members):
+        sheet_file_name = sheet_member[len(WORKSHEETS_DIR):]
+        if (not sheet_member.startswith(WORKSHEETS_DIR) or '/' in sheet_file_name
+                or not sheet_file_name.startswith('sheet') or not sheet_file_name.endswith('.xml')):
+            continue
+        
+        sheet_name = sheet_file_name[:-len('.xml')]
+        rels_member = f'{WORKSHEETS_DIR}_rels/{sheet_name}.xml.rels'
+        
+        if rels_member in members:
+            sheets.append((sheet_name, sheet_member, rels_member))
+    
+    if not sheets:
+        return deals
+    
+    # Results come back in sheet order, which keeps the cross-sheet deduplication stable
+    sheet_results = map_worksheets(parse_excel_worksheet_member, shared_strings,
+                                   [excel_path] * len(sheets),
+                                   [sheet_member for _, sheet_member, _ in sheets],
+                                   [rels_member for _, _, rels_member in sheets])
+    
+    for (sheet_name, _, _), sheet_rows in zip(sheets, sheet_results):
+        print(f"  Processing {sheet_name}...")
+        if sheet_rows is None:
+            continue
+        
+        sheet_deals = 0
+        for deal in sheet_rows:
+            # Skip if we've already seen this title (deduplication across sheets),
+            # ignoring case and whitespace differences
+            title_hash = hash(' '.join(deal['title'].split()).casefold())
+            if title_hash in seen_titles:
+                continue
+            seen_titles.add(title_hash)
             
             # Only include slickdeals URLs
-            if 'slickdeals.net' not in url:
+            if 'slickdeals.net' not in deal['link']:
                 continue
             
-            # Normalize the URL with tracking parameter
-            link = normalize_link(url)
-            
-            deal = {
-                'title': title,
-                'link': link,
-                'mainCategory': main_category if main_category else 'Uncategorized',
-                'subCategory': sub_category,
-                'salePrice': sale_price,
-                'originalPrice': original_price,
-                'store': store,
-                'salePeriod': sale_period,
-                'notes': notes,
-            }
             deals.append(deal)
             sheet_deals += 1
         
         print(f"    Extracted {sheet_deals} new deals from {sheet_name}")
-    
+
     return deals
 
 
 def import_from_excel(excel_path: str) -> list:
     """
-    Import deals from an Excel file (.xlsx) by extracting and parsing XML.
+    Import deals from an Excel file (.xlsx) by parsing its XML parts directly.
     
     This avoids using openpyxl which hangs on files with many hyperlinks.
     
@@ -253,24 +264,11 @@ def import_from_excel(excel_path: str) -> list:
     """
     print(f"Importing from Excel: {excel_path}")
     
-    # Create a temp directory to extract the xlsx
-    temp_dir = tempfile.mkdtemp(prefix='excel_import_')
+    # Extract deals with hyperlinks (the xlsx is a zip file of XML parts)
+    deals = extract_excel_deals(excel_path)
+    print(f"  Total deals extracted: {len(deals)}")
     
-    try:
-        # Extract the xlsx (it's a zip file)
-        print(f"  Extracting Excel to temp directory...")
-        with zipfile.ZipFile(excel_path, 'r') as zip_ref:
-            zip_ref.extractall(temp_dir)
-        
-        # Extract deals with hyperlinks
-        deals = extract_excel_deals(temp_dir)
-        print(f"  Total deals extracted: {len(deals)}")
-        
-        return deals
-        
-    finally:
-        # Clean up temp directory
-        shutil.rmtree(temp_dir, ignore_errors=True)
+    return deals
 
 
 # =============================================================================
@@ -297,20 +295,35 @@ def normalize_link(link):
         return link + '?sdtrk=bfsheet'
 
 
+class DealIdCharTable(dict):
+    """
+    str.translate table that deletes everything but alphanumerics and whitespace.
+    
+    Entries are filled in on first lookup, so the table covers all of Unicode
+    with the same str.isalnum()/str.isspace() rules as a per-character filter.
+    """
+    
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        self[codepoint] = codepoint if char.isalnum() or char.isspace() else None
+        return self[codepoint]
+
+
+DEAL_ID_CHARS = DealIdCharTable()
+
+
 def generate_deal_id(index, title):
     """
     Generate a unique deal ID from index and title.
     """
     # Use first few words of title for uniqueness
-    words = ''.join(c for c in title.lower() if c.isalnum() or c.isspace())
+    words = title.lower().translate(DEAL_ID_CHARS)
     words = '-'.join(words.split()[:5])
     return f'sheet-{index}-{words}'[:100]  # Limit length
 
 
-def generate_search_url(title):
-    """
-    Generate a Slickdeals search URL as a fallback for deals without hyperlinks.
-    """
+def clean_search_title(title: str) -> str:
+    """Strip price/store suffixes and variant notes from a title for use as a search query."""
     search_title = title
     for separator in [' $', ' from ', ' +', ' -', ' @']:
         if separator in search_title:
@@ -318,8 +331,17 @@ def generate_search_url(title):
     
     search_title = search_title.replace('(various colors)', '').replace('(various sizes)', '')
     search_title = search_title.replace('(select colors)', '').replace('(select sizes)', '')
-    search_title = ' '.join(search_title.split()).strip()
+    return ' '.join(search_title.split()).strip()
+
+
+@lru_cache(maxsize=8192)
+def generate_search_url(title):
+    """
+    Generate a Slickdeals search URL as a fallback for deals without hyperlinks.
     
+    Cached per title, covering both the title cleaning and the URL quoting.
+    """
+    search_title = clean_search_title(title)
     return f'https://slickdeals.net/newsearch.php?searchin=first&forumchoice%5B%5D=9&q={quote(search_title)}&sdtrk=bfsheet'
 
 
@@ -337,59 +359,70 @@ def import_from_sheet():
     print(f'WARNING: CSV export does not include hyperlinks. Use Excel import for actual URLs.')
     
     try:
-        # Fetch CSV data
+        # Fetch CSV data, parsing rows as the response streams in
         with urlopen(SHEET_CSV_URL) as response:
-            csv_data = response.read().decode('utf-8')
-        
-        # Parse CSV - skip first 3 header rows
-        lines = csv_data.splitlines()
-        # Find the actual header row (contains "Main Category")
-        header_line = None
-        for i, line in enumerate(lines):
-            if 'Main Category' in line and 'Item / Product' in line:
-                header_line = i
-                break
-        
-        if header_line is None:
-            print('Could not find header row in CSV')
-            return
-        
-        # Parse from header line onwards
-        csv_reader = csv.DictReader(lines[header_line:])
-        deals = []
-        
-        for index, row in enumerate(csv_reader, start=1):
-            # Skip header rows or empty rows
-            title = row.get('Item / Product', '').strip()
-            if not title or title.startswith('See all') or not row.get('Main Category'):
-                continue
+            csv_reader = csv.reader(io.TextIOWrapper(response, encoding='utf-8', newline=''))
             
-            # Extract data from CSV
-            main_category = row.get('Main Category', 'Uncategorized').strip()
-            sub_category = row.get('Sub Category', '').strip()
-            sale_price = row.get('Sale Price', '').strip()
-            original_price = row.get('Original Price', '').strip()
-            store = row.get('Store', '').strip()
-            sale_period = row.get('Sale Period', '').strip()
-            notes = row.get('Notes', '').strip()
+            # Skip the rows above the actual header row (contains "Main Category")
+            header = None
+            for row in csv_reader:
+                if any('Main Category' in cell for cell in row) and any('Item / Product' in cell for cell in row):
+                    header = row
+                    break
             
-            # CSV export doesn't include hyperlinks, use search URL as fallback
-            link = generate_search_url(title)
+            if header is None:
+                print('Could not find header row in CSV')
+                return
             
-            deal = {
-                'id': generate_deal_id(index, title),
-                'title': title,
-                'link': link,
-                'mainCategory': main_category,
-                'subCategory': sub_category,
-                'salePrice': sale_price,
-                'originalPrice': original_price,
-                'store': store,
-                'salePeriod': sale_period,
-                'notes': notes,
-                'pubDate': datetime.utcnow().isoformat() + 'Z'
-            }
-            deals.append(deal)
+            deals = []
+            
+            # Resolve column positions once from the header (the last column
+            # wins if a name repeats, as with DictReader)
+            columns = {name: i for i, name in enumerate(header)}
+            (title_col, main_col, sub_col, sale_col, original_col,
+             store_col, period_col, notes_col) = (
+                columns.get(name, -1) for name in (
+                    'Item / Product', 'Main Category', 'Sub Category', 'Sale Price',
+                    'Original Price', 'Store', 'Sale Period', 'Notes'))
+            
+            def cell(row, col):
+                """Value at a column position, or '' if the row doesn't have it."""
+                return row[col] if 0 <= col < len(row) else ''
+            
+            # Remaining (non-blank) rows are the deals
+            for index, row in enumerate((row for row in csv_reader if row), start=1):
+                # Skip header rows or empty rows
+                title = cell(row, title_col).strip()
+                main_category = cell(row, main_col)
+                if not title or title.startswith('See all') or not main_category:
+                    continue
+                
+                # Extract data from CSV
+                main_category = main_category.strip()
+                sub_category = cell(row, sub_col).strip()
+                sale_price = cell(row, sale_col).strip()
+                original_price = cell(row, original_col).strip()
+                store = cell(row, store_col).strip()
+                sale_period = cell(row, period_col).strip()
+                notes = cell(row, notes_col).strip()
+                
+                # CSV export doesn't include hyperlinks, use search URL as fallback
+                link = generate_search_url(title)
+                
+                deal = {
+                    'id': generate_deal_id(index, title),
+                    'title': title,
+                    'link': link,
+                    'mainCategory': main_category,
+                    'subCategory': sub_category,
+                    'salePrice': sale_price,
+                    'originalPrice': original_price,
+                    'store': store,
+                    'salePeriod': sale_period,
+                    'notes': notes,
+                    'pubDate': RUN_TIMESTAMP
+                }
+                deals.append(deal)
         
         print(f'Imported {len(deals)} deals from Google Sheets (CSV fallback)')
         return deals
@@ -403,8 +436,8 @@ def import_from_sheet():
 # MAIN IMPORT FUNCTION
 # =============================================================================
 
-def save_deals(deals: list, output_file: Path = None):
-    """Save deals to JSON file."""
+def save_deals(deals: list, output_file: Path = None, indent: int = None):
+    """Save deals to JSON file (compact one-deal-per-line unless indent is given)."""
     if output_file is None:
         output_file = DEALS_FILE
     
@@ -413,16 +446,15 @@ def save_deals(deals: list, output_file: Path = None):
         if 'id' not in deal:
             deal['id'] = generate_deal_id(index, deal.get('title', ''))
         if 'pubDate' not in deal:
-            deal['pubDate'] = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+            deal['pubDate'] = RUN_TIMESTAMP
     
     data = {
-        'lastUpdated': datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
+        'lastUpdated': RUN_TIMESTAMP,
         'deals': deals
     }
     
     output_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    save_deals_json(data, output_file, indent)
     
     print(f'Successfully saved {len(deals)} deals to {output_file}')
 
@@ -434,6 +466,7 @@ def main():
     Usage:
         python import_from_sheet.py                    # Import from Google Sheets CSV
         python import_from_sheet.py path/to/file.xlsx  # Import from Excel with hyperlinks
+        python import_from_sheet.py --pretty           # Write indented JSON for reading by hand
     """
     import argparse
     
@@ -460,6 +493,11 @@ Examples:
         default=DEALS_FILE,
         help=f'Output JSON file (default: {DEALS_FILE})'
     )
+    parser.add_argument(
+        '--pretty',
+        action='store_true',
+        help='Write fully indented JSON instead of one compact deal per line'
+    )
     
     args = parser.parse_args()
     
@@ -491,7 +529,7 @@ Examples:
     print(f'  Direct URLs (from hyperlinks): {direct_urls}')
     print(f'  Search URLs (fallback): {search_urls}')
     
-    save_deals(deals, args.output)
+    save_deals(deals, args.output, indent=2 if args.pretty else None)
 
 
 if __name__ == '__main__':
@@ -4,11 +4,15 @@ Recategorize Existing Deals Script
 Re-runs the enhanced categorize_item() function on all deals in deals.json
 """
 import json
+import os
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from datetime import datetime
 import importlib.util
 
+from deals_io import save_deals_json
+
 # Force fresh import of categorize_item from sync_combined to avoid module caching
 def load_categorize_item():
     """Load categorize_item with fresh import to avoid Python module caching"""
@@ -20,6 +24,10 @@ def load_categorize_item():
 
 categorize_item = load_categorize_item()
 
+def categorize_batch(batch):
+    """Categorize a batch of (title, link) pairs; runs in a worker process"""
+    return [categorize_item(title, link) for title, link in batch]
+
 def recategorize_deals():
     """Load deals.json, recategorize all deals, and save back"""
     deals_file = Path(__file__).parent.parent / 'data' / 'deals.json'
@@ -42,16 +50,32 @@ def recategorize_deals():
     uncategorized_before = sum(1 for d in deals if d.get('mainCategory') == 'Uncategorized')
     
     print("\nRecategorizing...")
-    for i, deal in enumerate(deals, 1):
-        if i % 500 == 0:
-            print(f"  Processed {i}/{total} deals...")
-        
+    
+    # categorize_item is pure, so each distinct (title, link) pair only needs
+    # categorizing once; repeats reuse the result
+    pairs = [(deal.get('title', ''), deal.get('link', '')) for deal in deals]
+    unique_pairs = list(dict.fromkeys(pairs))
+    unique_total = len(unique_pairs)
+    
+    # It is also CPU-bound, so spread the pairs over worker processes in
+    # batches (a few per worker to even out the load)
+    workers = os.cpu_count() or 1
+    batch_size = max(1, -(-unique_total // (workers * 4)))
+    batches = [unique_pairs[i:i + batch_size] for i in range(0, unique_total, batch_size)]
+    
+    new_cats = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for batch_cats in executor.map(categorize_batch, batches):
+            new_cats.extend(batch_cats)
+            print(f"  Processed {len(new_cats)}/{unique_total} distinct deals...")
+    
+    cat_by_pair = dict(zip(unique_pairs, new_cats))
+    
+    for deal, pair in zip(deals, pairs):
+        new_cat = cat_by_pair[pair]
         old_main = deal.get('mainCategory', '')
         old_sub = deal.get('subCategory', '')
         
-        # Re-run categorization
-        new_cat = categorize_item(deal.get('title', ''), deal.get('link', ''))
-        
         # Update if changed
         if new_cat['main'] != old_main or new_cat['sub'] != old_sub:
             deal['mainCategory'] = new_cat['main']
@@ -60,13 +84,15 @@ def recategorize_deals():
     
     uncategorized_after = sum(1 for d in deals if d.get('mainCategory') == 'Uncategorized')
     
-    # Update timestamp
-    data['lastUpdated'] = datetime.now().strftime('%Y-%m-%dT%H:%M:%SZ')
-    
-    # Save back
-    print("\nSaving updated deals.json...")
-    with open(deals_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2)
+    if changes:
+        # Update timestamp
+        data['lastUpdated'] = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+        
+        # Save back
+        print("\nSaving updated deals.json...")
+        save_deals_json(data, deals_file)
+    else:
+        print("\nNo category changes, leaving deals.json untouched")
     
     # Report results
     print("\n" + "="*60)
@@ -0,0 +1,82 @@
+"""
+Excel (.xlsx) XML Helpers
+Streaming SpreadsheetML parsing shared by the scripts that read worksheet hyperlinks
+"""
+
+import os
+import re
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+
+# Hyperlink relationships in a worksheet's .rels part, matched on the raw bytes
+RELATIONSHIP_RE = re.compile(rb'<Relationship\s+Id="(rId\d+)"[^>]*Type="[^"]*hyperlink"[^>]*Target="([^"]+)"')
+
+# Namespace-qualified SpreadsheetML tags, as reported by ElementTree.iterparse
+SPREADSHEET_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+SHARED_STRING_TAG = SPREADSHEET_NS + 'si'
+TEXT_RUN_TAG = SPREADSHEET_NS + 't'
+ROW_TAG = SPREADSHEET_NS + 'row'
+CELL_TAG = SPREADSHEET_NS + 'c'
+VALUE_TAG = SPREADSHEET_NS + 'v'
+HYPERLINK_TAG = SPREADSHEET_NS + 'hyperlink'
+HYPERLINKS_TAG = SPREADSHEET_NS + 'hyperlinks'
+RELATIONSHIP_ID_ATTR = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id'
+
+
+def scan_relationships(content) -> dict:
+    """Get rId -> URL mappings for hyperlinks from the bytes of a .rels part."""
+    rId_to_url = {}
+    
+    # Pattern: <Relationship Id="rIdXXX" ... Target="URL" TargetMode="External"/>
+    for match in RELATIONSHIP_RE.finditer(content):
+        rId = match.group(1).decode('utf-8')
+        # Decode HTML entities
+        url = match.group(2).decode('utf-8').replace('&amp;', '&')
+        rId_to_url[rId] = url
+    
+    return rId_to_url
+
+
+def iter_shared_strings(shared_strings_file):
+    """Yield sharedStrings.xml values (path or binary file object) in index order."""
+    # Stream each <si> element (string item) instead of loading the whole file;
+    # each <si> can contain one or more <t> elements
+    for _, elem in ET.iterparse(shared_strings_file):
+        if elem.tag != SHARED_STRING_TAG:
+            continue
+        
+        # Combine all text from the <t> elements within this <si>
+        yield ''.join(t.text or '' for t in elem.iter(TEXT_RUN_TAG)).strip()
+        elem.clear()
+
+
+# Shared strings for worksheet worker processes. Set once per worker by the
+# pool initializer so the (large) list isn't pickled along with every sheet.
+_worker_shared_strings = []
+
+
+def _init_worksheet_worker(shared_strings: list):
+    global _worker_shared_strings
+    _worker_shared_strings = shared_strings
+
+
+def _parse_in_worker(parse_sheet, *args):
+    return parse_sheet(*args, _worker_shared_strings)
+
+
+def map_worksheets(parse_sheet, shared_strings: list, *iterables) -> list:
+    """
+    Call parse_sheet(*args, shared_strings) for each sheet's args, in sheet order.
+    
+    Worksheets are independent, so several sheets are parsed across processes;
+    a single sheet (or a single core) is parsed in-process instead of starting
+    a one-worker pool. parse_sheet must be a module-level function.
+    """
+    sheet_args = list(zip(*iterables))
+    max_workers = min(len(sheet_args), os.cpu_count() or 1)
+    if max_workers <= 1:
+        return [parse_sheet(*args, shared_strings) for args in sheet_args]
+    
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worksheet_worker,
+                             initargs=(shared_strings,)) as executor:
+        return list(executor.map(_parse_in_worker, [parse_sheet] * len(sheet_args), *zip(*sheet_args)))
@@ -0,0 +1,72 @@
+"""Tests for scripts/deals_io.py"""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+import deals_io
+
+
+class DumpDealsJsonTest(unittest.TestCase):
+    def dump(self, data):
+        f = io.StringIO()
+        deals_io.dump_deals_json(data, f)
+        return f.getvalue()
+
+    def test_one_compact_deal_per_line(self):
+        data = {
+            'lastUpdated': '2025-11-28T00:00:00Z',
+            'deals': [
+                {'id': 'a', 'title': 'Café Press €20', 'tags': ['x', 'y']},
+                {'id': 'b', 'title': 'Lego Set'},
+            ],
+        }
+
+        self.assertEqual(self.dump(data), (
+            '{\n'
+            '  "lastUpdated": "2025-11-28T00:00:00Z",\n'
+            '  "deals": [\n'
+            '    {"id":"a","title":"Café Press €20","tags":["x","y"]},\n'
+            '    {"id":"b","title":"Lego Set"}\n'
+            '  ]\n'
+            '}\n'
+        ))
+
+    def test_round_trips_through_json_load(self):
+        data = {'lastUpdated': '', 'deals': [{'id': 'a', 'notes': 'multi\nline "note"'}]}
+        self.assertEqual(json.loads(self.dump(data)), data)
+
+    def test_empty_deals(self):
+        data = {'lastUpdated': '', 'deals': []}
+        self.assertEqual(json.loads(self.dump(data)), data)
+
+    def test_indent_writes_fully_indented_json(self):
+        data = {'lastUpdated': '', 'deals': [{'id': 'a', 'title': 'Café'}]}
+        f = io.StringIO()
+        deals_io.dump_deals_json(data, f, indent=2)
+
+        self.assertEqual(f.getvalue(), json.dumps(data, ensure_ascii=False, indent=2) + '\n')
+
+
+class SaveDealsJsonTest(unittest.TestCase):
+    def test_replaces_file_and_leaves_no_temp_file(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            deals_file = os.path.join(tmp_dir, 'deals.json')
+            with open(deals_file, 'w', encoding='utf-8') as f:
+                f.write('{"deals": []}')
+
+            data = {'lastUpdated': '', 'deals': [{'id': 'a'}]}
+            deals_io.save_deals_json(data, deals_file)
+
+            with open(deals_file, encoding='utf-8') as f:
+                self.assertEqual(json.load(f), data)
+            self.assertEqual(os.listdir(tmp_dir), ['deals.json'])
+
+
+if __name__ == '__main__':
+    unittest.main()
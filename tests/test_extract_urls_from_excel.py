@@ -0,0 +1,105 @@
+"""Tests for scripts/extract_urls_from_excel.py"""
+
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(__file__), '..', 'scripts')
+sys.path.insert(0, SCRIPTS_DIR)
+
+SCRIPT = os.path.join(SCRIPTS_DIR, 'extract_urls_from_excel.py')
+spec = importlib.util.spec_from_file_location('extract_urls_from_excel', SCRIPT)
+extract_urls = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(extract_urls)
+
+
+class UpdateDealsJsonTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.deals_file = os.path.join(self.tmp_dir.name, 'deals.json')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write_deals(self, deals):
+        with open(self.deals_file, 'w', encoding='utf-8') as f:
+            json.dump({'lastUpdated': '', 'deals': deals}, f)
+
+    def read_deals(self):
+        with open(self.deals_file, encoding='utf-8') as f:
+            return json.load(f)['deals']
+
+    def test_matches_title_with_raw_html_entities(self):
+        # deals.json titles may still hold entities; sheet titles arrive decoded
+        search_link = 'https://slickdeals.net/newsearch.php?q=Tom%20%26amp%3B%20Jerry'
+        deal_url = 'https://slickdeals.net/f/123-tom-and-jerry'
+        self.write_deals([
+            {'title': 'Tom &amp; Jerry &quot;Boxed&quot; Set', 'link': search_link},
+        ])
+
+        updated, total = extract_urls.update_deals_json(
+            self.deals_file, {'Tom & Jerry "Boxed" Set': deal_url})
+
+        self.assertEqual((updated, total), (1, 1))
+        self.assertEqual(self.read_deals()[0]['link'], deal_url)
+
+
+class ParseRelationshipsTest(unittest.TestCase):
+    def test_empty_rels_file_has_no_relationships(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            rels_file = os.path.join(tmp_dir, 'sheet1.xml.rels')
+            open(rels_file, 'wb').close()
+
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                rId_to_url = extract_urls.parse_relationships(rels_file)
+
+        self.assertEqual(rId_to_url, {})
+        self.assertEqual(output.getvalue(), '')
+
+
+class ParseSheetDealUrlsTest(unittest.TestCase):
+    SHEET_XML = '''<?xml version="1.0" encoding="UTF-8"?>
+<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+           xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">
+  <sheetData>
+    <row r="2"><c r="C2" t="s"><v>0</v></c></row>
+    <row r="3"><c r="C3"><v>123</v></c></row>
+    <row r="4"><c r="C4" t="s"><v>99</v></c></row>
+  </sheetData>
+  <hyperlinks>
+    <hyperlink ref="C2" r:id="rId1"/>
+    <hyperlink ref="C3" r:id="rId2"/>
+    <hyperlink ref="C4" r:id="rId3"/>
+  </hyperlinks>
+</worksheet>'''
+
+    RELS_XML = '''<?xml version="1.0" encoding="UTF-8"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+  <Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink" Target="https://slickdeals.net/f/1-real-deal" TargetMode="External"/>
+  <Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink" Target="https://slickdeals.net/f/2-numeric-cell" TargetMode="External"/>
+  <Relationship Id="rId3" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink" Target="https://slickdeals.net/f/3-stale-index" TargetMode="External"/>
+</Relationships>'''
+
+    def test_only_shared_string_titles_are_mapped(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            sheet_file = os.path.join(tmp_dir, 'sheet1.xml')
+            rels_file = os.path.join(tmp_dir, 'sheet1.xml.rels')
+            with open(sheet_file, 'w', encoding='utf-8') as f:
+                f.write(self.SHEET_XML)
+            with open(rels_file, 'w', encoding='utf-8') as f:
+                f.write(self.RELS_XML)
+
+            _, _, title_to_url = extract_urls.parse_sheet_deal_urls(
+                sheet_file, rels_file, ['Real Deal $10'])
+
+        self.assertEqual(title_to_url, {'Real Deal $10': 'https://slickdeals.net/f/1-real-deal'})
+
+
+if __name__ == '__main__':
+    unittest.main()
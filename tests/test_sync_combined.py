@@ -0,0 +1,128 @@
+"""Tests for scripts/sync_combined.py"""
+
+import importlib.util
+import os
+import sys
+import unittest
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(__file__), '..', 'scripts')
+sys.path.insert(0, SCRIPTS_DIR)
+
+# sync_combined imports feedparser at module level (see scripts/requirements.txt)
+HAS_FEEDPARSER = importlib.util.find_spec('feedparser') is not None
+
+if HAS_FEEDPARSER:
+    SCRIPT = os.path.join(SCRIPTS_DIR, 'sync_combined.py')
+    spec = importlib.util.spec_from_file_location('sync_combined', SCRIPT)
+    sync_combined = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(sync_combined)
+
+
+@unittest.skipUnless(HAS_FEEDPARSER, 'feedparser is not installed')
+class CategorizeItemTest(unittest.TestCase):
+    def assertCategory(self, title, main, sub, link=''):
+        self.assertEqual(sync_combined.categorize_item(title, link), {'main': main, 'sub': sub})
+
+    def test_one_title_per_priority_tier(self):
+        cases = [
+            ('Tide Laundry Detergent Pods 81ct $15', 'Grocery', 'Household Goods'),
+            ('Audible Premium Plus 3 Months Free', 'Books & Magazines', 'Audiobooks'),
+            ('Kindle Book Sale: Thrillers $1.99', 'Books & Magazines', 'eBooks'),
+            ('The Hobbit Hardcover $8', 'Books & Magazines', 'Books'),
+            ('Paw Patrol Plush Set $10', 'Babies & Kids', 'Kids Toys'),
+            ('Graco Stroller $120', 'Babies & Kids', 'Baby Products'),
+            ('PS5 Slim Console $399', 'Video Games', 'Video Game Consoles'),
+            ('Xbox Game Pass Ultimate 3 Months $45', 'Video Games', 'Video Game Memberships'),
+            ('Samsung Galaxy Tab A9 $109', 'Electronics', 'Tablets'),
+            ('Dell XPS 13 Laptop $899', 'Computers', 'Laptops'),
+            ('Norton 360 Deluxe 1-Year $19', 'Software', 'Security Software'),
+            ('Sony WH-1000XM5 Headphones $278', 'Electronics', 'Headphones, Headsets & Earbuds'),
+            ('Funko Pop Star Wars $7', 'Entertainment', 'Collectibles & Toys'),
+            ('Disney+ Annual Plan $79', 'Entertainment', 'Streaming Services'),
+            ('Centrum Multivitamin 200ct $12', 'Health & Personal Care', 'Medicine & Supplements'),
+            ('Jif Peanut Butter 2-Pack $6', 'Grocery', 'Spreads & Butters'),
+            ('Barilla Pasta 6-Pack $8', 'Grocery', 'Pasta'),
+            ('OXO Storage Containers 10pc $30', 'Home & Home Improvement', 'Storage & Organization'),
+            ('Weber Gas Grill $399', 'Home & Home Improvement', 'Grills & Grilling Accessories'),
+            ('Pre-Lit Christmas Tree 7.5ft $99', 'Seasonal', 'Christmas Trees'),
+            ("Levi's 501 Jeans $30", 'Clothing & Accessories', 'Apparel'),
+            ('Nike Running Shoes $60', 'Clothing & Accessories', 'Shoes'),
+            ('Cotton Swabs 500ct $3', 'Health & Beauty', 'Personal Care'),
+            ('Hydro Flask Water Bottle $25', 'Sporting Goods', 'Water Bottles'),
+            ('Dash Cam 4K Front and Rear $49', 'Autos', 'Car Accessories'),
+            ('Marriott Hotel Weekend Sale', 'Travel & Vacations', 'Hotels'),
+            ('Amazon Gift Card $50 Promo', 'Flowers & Gifts', 'Gift Cards'),
+            ('Pizza Hut Large 3-Topping $10', 'Restaurants', 'Pizza'),
+            ('Shutterfly Photo Book $10', 'Office & School Supplies', 'Photo Printing'),
+            ('Blue Buffalo Dog Food 30lb $45', 'Pets', 'Dog Food & Treats'),
+            ('Commercial Ice Machine $299', 'Business & Industrial', 'Commercial Equipment'),
+        ]
+        for title, main, sub in cases:
+            with self.subTest(title=title):
+                self.assertCategory(title, main, sub)
+
+    def test_earlier_rule_wins_on_overlapping_keywords(self):
+        # 'laundry' (Household Goods) comes before 'barbie' (Kids Toys)
+        self.assertCategory('Laundry Basket Barbie Edition $9', 'Grocery', 'Household Goods')
+        # 'hot wheels' (Kids Toys) comes before 'ps5' (Consoles)
+        self.assertCategory('Hot Wheels PS5 Edition Racing Set $25', 'Babies & Kids', 'Kids Toys')
+        # 'ps5' (Consoles) comes before 'dualsense' (Controllers)
+        self.assertCategory('PS5 Controller DualSense $49', 'Video Games', 'Video Game Consoles')
+        # 'cooler' (Sporting Goods) comes before 'wine cooler' (Business & Industrial)
+        self.assertCategory('Whynter Wine Cooler 18-Bottle $199', 'Sporting Goods', 'Coolers')
+        # 'dryer' (Washers & Dryers) comes before 'hair dryer' (Health & Beauty)
+        self.assertCategory('Remington Hair Dryer $25', 'Home & Home Improvement', 'Washers & Dryers')
+
+    def test_book_condition(self):
+        self.assertCategory('Atomic Habits Book $11', 'Books & Magazines', 'Books')
+        # 'photo book' is excluded from the book condition and falls through to Photo Printing
+        self.assertCategory('Shutterfly Photo Book $10', 'Office & School Supplies', 'Photo Printing')
+        self.assertCategory('Apple MacBook Air M3 13" $799', 'Computers', 'Laptops')
+
+    def test_tablet_condition(self):
+        self.assertCategory('Amazon Fire HD 10 Tablet $69', 'Electronics', 'Tablets')
+        self.assertCategory('Adjustable Tablet Stand for Desk $14', 'Home & Home Improvement', 'Furniture')
+
+    def test_wifi_condition(self):
+        self.assertCategory('Wi-Fi Smart Plug 4-Pack $15', 'Computers', 'Computer Networking')
+        # Tablet and phone titles are excluded from the wi-fi condition
+        self.assertCategory('Wi-Fi Tablet 10" $89', 'Electronics', 'Tablets')
+        self.assertCategory('Wi-Fi iPhone Case $9', 'Electronics', 'Cell Phones & Plans')
+
+    def test_coffee_needs_context(self):
+        self.assertCategory('Starbucks Coffee Beans 2lb $14', 'Grocery', 'Drinks & Beverages')
+        self.assertCategory('Ninja Coffee Maker $79', 'Home & Home Improvement', 'Small Appliances')
+        self.assertCategory('Coffee Mug Set 4pc $20', 'Uncategorized', '')
+
+    def test_stove_oven_condition(self):
+        self.assertCategory('GE Gas Stove 30" $699', 'Home & Home Improvement', 'Stoves')
+        # 'dutch oven' is a Kitchen & Cookware keyword, and that rule comes first
+        self.assertCategory('Lodge Dutch Oven 6qt $40', 'Home & Home Improvement', 'Kitchen & Cookware')
+
+    def test_watch_condition(self):
+        self.assertCategory('Casio G-Shock Watch $59', 'Clothing & Accessories', 'Watches')
+        self.assertCategory('Apple Watch Series 10 $299', 'Electronics', 'Smart Watches & Wearables')
+        # An earlier keyword beats the later watch condition
+        self.assertCategory('Hoodie Watch Cap $10', 'Clothing & Accessories', 'Apparel')
+        # 'watchmen' is not the word 'watch'
+        self.assertCategory('Watchmen Blu-ray $10', 'Entertainment', 'Movies')
+
+    def test_camping_condition(self):
+        self.assertCategory('Camping Lantern 2-Pack $19', 'Sporting Goods', 'Camping & Outdoor')
+        self.assertCategory('Coleman Camping Chair $25', 'Uncategorized', '')
+
+    def test_keyword_only_in_link(self):
+        self.assertCategory('Mystery Deal $5', 'Entertainment', 'Collectibles & Toys',
+                            link='https://slickdeals.net/f/123-lego-star-wars-set')
+        self.assertCategory('Deal of the Day', 'Sporting Goods', 'Camping & Outdoor',
+                            link='https://slickdeals.net/f/9-stainless-camping-mug')
+
+    def test_uncategorized_fallback(self):
+        self.assertCategory('Zzyzx Widget $5', 'Uncategorized', '')
+        self.assertCategory('Mystery Deal $5', 'Uncategorized', '',
+                            link='https://slickdeals.net/f/123-mystery-deal')
+        self.assertCategory('Mystery Deal $5', 'Uncategorized', '', link=None)
+
+
+if __name__ == '__main__':
+    unittest.main()